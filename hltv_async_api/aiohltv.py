@@ -1,13 +1,49 @@
 import asyncio
 import logging
+import os
+import random
 import re
-from datetime import date, datetime, timedelta
-from functools import partial
-from typing import Any, List
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any
 
 import pytz
-from aiohttp import ClientSession
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from .backends import BACKENDS, IdleCloser
+
+
+# css selectors reused by several parsers
+_MATCH_TEAM_NAME = 'div.matchTeamName.text-ellipsis'
+_MATCH_EVENT_NAME = 'div.matchEventName.gtSmartphone-only'
+_MATCH_EVENT_NAME_SHORT = 'span.line-clamp-3'
+_RESULT_TEAM = 'td.team-cell'
+_RESULT_SCORE = 'td.result-score'
+_RESULT_STAR = 'i.fa.fa-star.star'
+_RESULT_EVENT = 'span.event-name'
+_ONGOING_EVENT = 'a.a-reset.ongoing-event'
+# live matches, day headlines and upcoming matches of an event page in document order
+_EVENT_MATCH_NODES = ('div.liveMatchesSection div.liveMatch-container, '
+                      'div.upcomingMatchesSection span.matchDayHeadline, '
+                      'div.upcomingMatchesSection div.upcomingMatch')
+_EVENT_DATE = 'span[data-time-format="MMM do"]'
+_TEAM_CHANGE = 'div.change:is(.positive, .neutral, .negative)'
+_PLAYER_RATING = 'td.ratingCol:is(.ratingPositive, .ratingNeutral, .ratingNegative)'
+_RANKED_TEAM = 'div.ranked-team.standard-box'
+
+# 'Jan' -> '1', spelled out because calendar.month_abbr follows the process locale
+_MONTHS = {month: str(i) for i, month in enumerate(('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                                                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)}
+
+# seconds a fetched page is reused, e.g. for several /matches parsers called together
+_PAGE_TTL = 5.0
+
+
+def _parse_html(result: str) -> LexborHTMLParser:
+    return LexborHTMLParser(result)
 
 
 class Hltv:
@@ -22,6 +58,8 @@ class Hltv:
                  proxy_protocol: str | None = None,
                  delete_proxy: bool = False,
                  tz: str = 'Europe/Copenhagen',
+                 max_concurrency: int = 16,
+                 backend: str = 'aiohttp',
                  ):
         self.flaresolverr = flaresolverr
         self.night = night
@@ -36,30 +74,44 @@ class Hltv:
         self.MAX_DELAY = max_delay
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
         self.TIMEZONE = tz
         self._check_tz()
 
+        self.BACKEND = backend
+        self._check_backend()
+
         self.PROXY_PATH = proxy_path
-        self.PROXY_LIST = proxy_list
         self.PROXY_PROTOCOL = proxy_protocol
         self.PROXY_ONCE = delete_proxy
+        self.PROXY_LIST = deque()
 
         if self.PROXY_PATH:
-            with open(self.PROXY_PATH, "r") as file:
-                self.PROXY_LIST = [line.strip() for line in file.readlines()]
-
-        if self.PROXY_PROTOCOL:
-            self.PROXY_LIST = [self.PROXY_PROTOCOL + '://' + proxy for i, proxy in enumerate(self.PROXY_LIST, start=0)]
+            self._load_proxy_file()
+        elif proxy_list:
+            self._load_proxies(proxy_list)
 
         if proxy_path or proxy_list:
             self.USE_PROXY = True
         else:
             self.USE_PROXY = False
 
-        self.session = None
+        self._backend = None
+        self._parse_pool = None
+        # closing a switched backend awaits, concurrent fetches must not create backends meanwhile
+        self._session_lock = asyncio.Lock()
+        # a replaced backend is closed once the requests still running on it are finished
+        self._backends_in_use = IdleCloser(lambda backend: backend.close())
         self.loop = asyncio.get_running_loop()
 
+        # url -> (fetched at, page) and url -> [task of the fetch currently running, number of its callers]
+        self._page_cache: dict[str, tuple[float, Any]] = {}
+        self._in_flight: dict[str, list] = {}
+        # (iso week + max_teams, teams) of the last ranking, the ranking is updated weekly
+        self._rank_cache: tuple[str, list] | None = None
+
     async def __aenter__(self):
         await self._create_session()
         return self
@@ -67,16 +119,43 @@ class Hltv:
     async def __aexit__(self, exc_type, exc, tb):
         await self.close()
 
+    def _backend_outdated(self) -> bool:
+        # backend or max_concurrency was changed with config()
+        return (self._backend.name != self.BACKEND
+                or self._backend.max_connections != self.max_concurrency)
+
     async def _create_session(self):
-        if not self.session:
-            self.logger.debug('Creating Session')
-            self.session = ClientSession()
+        if self._backend and not self._backend_outdated() and self._parse_pool:
+            return
+
+        async with self._session_lock:
+            if self._backend and self._backend_outdated():
+                self._backends_in_use.retire(self._backend)
+                self._backend = None
+            if not self._backend:
+                self.logger.debug(f'Creating Session ({self.BACKEND})')
+                # connection pool matches max_concurrency, all requests go to the same flaresolverr host
+                self._backend = BACKENDS[self.BACKEND](self.headers, self.timeout, self.max_concurrency)
+                await self._backends_in_use.close_idle()
+            if not self._parse_pool:
+                # lexbor parses without holding the GIL, so pages are parsed in parallel on these threads
+                self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='hltv-parse')
 
     async def close(self):
-        if self.session:
+        # fetches retry forever by default, stop them before their session is closed
+        tasks = [task for task, _ in self._in_flight.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._backend:
             self.logger.debug('Closing Session')
-            await self.session.close()
-            self.session = None
+            await self._backend.close()
+            self._backend = None
+        await self._backends_in_use.close_all()
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
 
     def _configure_logging(self):
         level = logging.DEBUG if self.DEBUG else logging.INFO
@@ -92,6 +171,8 @@ class Hltv:
                proxy_protocol: str | None = None,
                delete_proxy: bool | None = None,
                tz: str = None,
+               max_concurrency: int | None = None,
+               backend: str | None = None,
                ):
         if max_delay:
             self.MAX_DELAY = max_delay
@@ -100,22 +181,29 @@ class Hltv:
         if use_proxy is not None:
             self.USE_PROXY = use_proxy
         if proxy_list:
-            self.PROXY_LIST = proxy_list
+            self._load_proxies(proxy_list)
         if max_retries:
             self.max_retries = max_retries
+        if max_concurrency:
+            self.max_concurrency = max_concurrency
+            self._semaphore = asyncio.Semaphore(max_concurrency)
         if proxy_protocol:
             self.PROXY_PROTOCOL = proxy_protocol
+            self._load_proxies(self.PROXY_LIST)
         if delete_proxy is not None:
             self.PROXY_ONCE = delete_proxy
         if tz is not None:
             self.TIMEZONE = tz
             self._check_tz()
+        if backend is not None:
+            self.BACKEND = backend
+            self._check_backend()
         if debug is not None:
             self.DEBUG = debug
             self._configure_logging()
         if proxy_file_path:
-            with open(self.PROXY_PATH, "r") as file:
-                self.PROXY_LIST = [line.strip() for line in file.readlines()]
+            self.PROXY_PATH = proxy_file_path
+            self._load_proxy_file()
 
     def _check_tz(self):
         try:
@@ -124,116 +212,149 @@ class Hltv:
             self.logger.error('UnknownTimeZoneError, using default timezone: Europe/Copenhagen')
             self.TIMEZONE = 'Europe/Copenhagen'
 
-    def _get_proxy(self):
-        proxy = self.PROXY_LIST[0]
+    def _check_backend(self):
+        if self.BACKEND not in BACKENDS:
+            self.logger.error(f'Unknown backend {self.BACKEND}, using default backend: aiohttp')
+            self.BACKEND = 'aiohttp'
 
-        if self.PROXY_PROTOCOL and proxy != '' and self.PROXY_PROTOCOL not in proxy:
-            proxy = self.PROXY_PROTOCOL + '://' + proxy
+    def _load_proxy_file(self):
+        # proxies are read from disk only here, rotation works on the in-memory deque
+        with open(self.PROXY_PATH, "r") as file:
+            self._load_proxies(line.strip() for line in file)
 
-        return proxy
+    def _load_proxies(self, proxies):
+        # '' stands for "no proxy" and is kept as is
+        protocol = self.PROXY_PROTOCOL
+        self.PROXY_LIST = deque(protocol + '://' + proxy if protocol and proxy and '://' not in proxy else proxy
+                                for proxy in proxies)
+
+    def _get_proxy(self):
+        return self.PROXY_LIST[0]
 
     def _switch_proxy(self):
         if self.PROXY_ONCE:
             self.logger.debug(f'Removing proxy {self.PROXY_LIST[0]}')
-            self.PROXY_LIST = self.PROXY_LIST[1:]
+            self.PROXY_LIST.popleft()
         else:
             self.logger.debug(f"Switching proxy {self.PROXY_LIST[0] if self.PROXY_LIST[0] else 'No Proxy'}")
-            self.PROXY_LIST = self.PROXY_LIST[1:] + [(self.PROXY_LIST[0])]
+            self.PROXY_LIST.rotate(-1)
             self.logger.info(f"New proxy: {self.PROXY_LIST[0] if self.PROXY_LIST[0] else 'No Proxy'}")
 
-    @staticmethod
-    def _f(result):
-        return BeautifulSoup(result, "lxml")
-
-    def _cloudflare_check(self, page) -> bool:
-        challenge_page = page.find(id="challenge-error-title")
-        if challenge_page is not None:
-            if "Enable JavaScript and cookies to continue" in challenge_page.get_text().strip():
-                self.logger.debug("Got cloudflare challenge page")
-                return True
+    def _cloudflare_check(self, result: str) -> bool:
+        # plain substring scan, challenge pages are never parsed
+        if 'id="challenge-error-title"' in result and "Enable JavaScript and cookies to continue" in result:
+            self.logger.debug("Got cloudflare challenge page")
+            return True
         return False
 
-    def _parse_error_handler(self, delay: int = 0) -> int:
+    def _parse_error_handler(self, attempt: int) -> float:
         if self.USE_PROXY:
             self._switch_proxy()
-        else:
-            if delay < self.MAX_DELAY:
-                delay += 1
-            else:
-                self.logger.debug("Reached max delay limit, try to use proxy")
-            self.logger.info(f"Calling again, increasing delay to {delay}s")
+            return 0
+
+        # exponential backoff with jitter, only for non-proxy users
+        delay = min(self.MAX_DELAY, 2 ** min(attempt, 10) + random.uniform(0, 1))
+        if delay == self.MAX_DELAY:
+            self.logger.debug("Reached max delay limit, try to use proxy")
+        self.logger.info(f"Calling again, increasing delay to {round(delay, 1)}s")
 
         return delay
 
-    async def _parse(self, url, delay):
+    async def _parse(self, url):
+        """Single fetch attempt, returns parsed page or None if it has to be retried"""
         proxy = ''
         # setup new proxy, cuz old one was switched
         if self.USE_PROXY:
             proxy = self._get_proxy()
-        else:
-            # delay, only for non-proxy users. (default = 1-15s)
-            await asyncio.sleep(delay)
         try:
-            async with self.session.post(f'{self.flaresolverr.removesuffix("/")}/v1',
-                                         json={'cmd': 'request.get', 'url': url, 'maxTimeout': 60000,
-                                               'cookies': [{'name': 'nightmode', 'value': 'on'}]},
-                                         headers=self.headers, proxy=proxy, timeout=self.timeout) as response:
-                self.logger.info(f"Fetching {url}, code: {response.status}")
-                if response.status == 403 or response.status == 404:
-                    self.logger.debug("Got 403 forbitten")
-                    return False, await self.loop.run_in_executor(None, partial(self._parse_error_handler, delay))
-                    # return False, self._parse_error_handler(delay)
-
-                # checking for challenge page.
-                json = (await response.json())
-                result = json["solution"]["response"]
-                page = await self.loop.run_in_executor(None, partial(self._f, result))
-                forbitten = await self.loop.run_in_executor(None, partial(self._cloudflare_check, page))
-                # forbitten, parsed = self._cloudflare_check(result)
-                if forbitten:
-                    return False, await self.loop.run_in_executor(None, partial(self._parse_error_handler, delay))
-                    # return False, self._parse_error_handler(delay)
-                return True, page
+            # the backend stays open until this request is finished, even if config() replaces it
+            backend = self._backends_in_use.acquire(self._backend)
+            try:
+                status, solution = await backend.post(f'{self.flaresolverr.removesuffix("/")}/v1',
+                                                  {'cmd': 'request.get', 'url': url, 'maxTimeout': 60000,
+                                                   'cookies': [{'name': 'nightmode', 'value': 'on'}]},
+                                                  proxy, self.timeout)
+            finally:
+                await self._backends_in_use.release(backend)
+            self.logger.info(f"Fetching {url}, code: {status}")
+            if status == 403 or status == 404:
+                self.logger.debug("Got 403 forbitten")
+                return None
+
+            result = solution["solution"]["response"]
+            # checking for challenge page.
+            if self._cloudflare_check(result):
+                return None
+            page = await self.loop.run_in_executor(self._parse_pool, _parse_html, result)
+            return page
         except Exception as e:
             self.logger.debug(e)
-            delay = self._parse_error_handler(delay)
-            return False, delay
-
-    async def _fetch(self, url, delay: int = 0):
-        if not self.session:
-            await self._create_session()
-        status = False
-        try_ = 1
-        result = None
-
-        # parse until success or not max retries
-        while (not status) and (try_ != self.max_retries):
-            self.logger.debug(f'Trying connect to {url}, try {try_}/{self.max_retries}')
-
-            # if status = True, result = page,
-            # if status = False, result = delay (default=0)
-            status, result = await self._parse(url, delay)
-
-            if not status and result:
-                delay = result
-            try_ += 1
-
-        if status:
-            return result
-        else:
-            self.logger.error('Connection failed')
             return None
 
+    async def _fetch(self, url):
+        hit = self._page_cache.get(url)
+        if hit and time.monotonic() - hit[0] < _PAGE_TTL:
+            self.logger.debug(f'Using cached {url}')
+            return hit[1]
+
+        # single flight, concurrent callers of the same url share one fetch task. shield keeps
+        # a cancelled caller from cancelling the fetch for the others
+        entry = self._in_flight.get(url)
+        if entry is None:
+            entry = self._in_flight[url] = [asyncio.ensure_future(self._fetch_page(url)), 0]
+            entry[0].add_done_callback(lambda done: self._fetch_done(url, done))
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if not entry[1] and not task.done():
+                # the last caller is gone, nobody needs the page any more
+                del self._in_flight[url]
+                task.cancel()
+
+    def _fetch_done(self, url, task: asyncio.Task):
+        # the entry is already removed if the task was cancelled by its last caller
+        if self._in_flight.get(url, [None])[0] is task:
+            del self._in_flight[url]
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        result = task.result()
+        if result:
+            now = time.monotonic()
+            self._page_cache = {key: entry for key, entry in self._page_cache.items() if now - entry[0] < _PAGE_TTL}
+            self._page_cache[url] = (now, result)
+
+    async def _fetch_page(self, url):
+        await self._create_session()
+        attempt = 0
+        delay = 0
+
+        # parse until success or max retries (0 or less - infinity)
+        while self.max_retries <= 0 or attempt < self.max_retries:
+            self.logger.debug(f'Trying connect to {url}, try {attempt + 1}/{self.max_retries}')
+
+            # delay, only for non-proxy users. (default = 0-15s)
+            await asyncio.sleep(delay)
+            async with self._semaphore:
+                page = await self._parse(url)
+
+            if page is not None:
+                return page
+            attempt += 1
+            if self.USE_PROXY and self.PROXY_ONCE and self.PROXY_LIST:
+                # the error handler removes this proxy, its connections are not needed any more
+                await self._backend.discard(self._get_proxy())
+            delay = self._parse_error_handler(attempt)
+
+        self.logger.error('Connection failed')
+        return None
+
     @staticmethod
     def _normalize_date(parts) -> str:
-        month_abbreviations = {
-            'Jan': '1', 'Feb': '2', 'Mar': '3', 'Apr': '4',
-            'May': '5', 'Jun': '6', 'Jul': '7', 'Aug': '8',
-            'Sep': '9', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-        }
-        month = month_abbreviations[parts[0]]
-        day = parts[1][:-2]
-        return day + '-' + month
+        return parts[1][:-2] + '-' + _MONTHS[parts[0]]
 
     @staticmethod
     def __normalize_date(date_) -> str:
@@ -243,6 +364,14 @@ class Hltv:
         date = datetime.strptime(date_string, "%B%d%Y")
         return date.strftime("%d-%m-%Y")
 
+    @staticmethod
+    def _logo_url(logo: LexborNode) -> str:
+        attrs = logo.attributes
+        if 'src' in attrs:
+            return 'https://www.hltv.org' + attrs['src'] if attrs['src'].startswith("/") else attrs['src']
+        srcset = attrs['srcset']
+        return ('https://www.hltv.org' + srcset if srcset.startswith("/") else srcset).replace("&amp;", "&")
+
     def _localize_datetime_to_timezone(self, date_: datetime = None, date_str: str = None) -> datetime:
         if self.TIMEZONE == 'Europe/Copenhagen':
             return date_
@@ -285,21 +414,22 @@ class Hltv:
 
         try:
             if live:
-                for live_div in r.find_all('div', class_='liveMatch-container'):
-                    rating = int(live_div['stars'])
+                for live_div in r.css('div.liveMatch-container'):
+                    attrs = live_div.attributes
+                    rating = int(attrs['stars'])
                     if rating >= min_rating:
-                        id = live_div['data-scorebot-id']
-                        t1_id = live_div['team1']
-                        t2_id = live_div['team2']
-                        teams = live_div.find_all('div', {'class': 'matchTeamName text-ellipsis'})
-                        team1 = teams[0].text
-                        team2 = teams[1].text
-                        maps = live_div.find('div', {'class': 'matchMeta'}).text[-1:]
+                        id = attrs['data-scorebot-id']
+                        t1_id = attrs['team1']
+                        t2_id = attrs['team2']
+                        teams = live_div.css(_MATCH_TEAM_NAME)
+                        team1 = teams[0].text()
+                        team2 = teams[1].text()
+                        maps = live_div.css_first('div.matchMeta').text()[-1:]
                         try:
-                            event = live_div.find('div', {'class', 'matchEventName gtSmartphone-only'}).text
+                            event = live_div.css_first(_MATCH_EVENT_NAME).text()
                         except AttributeError:
                             try:
-                                event = live_div.find('span', {'class': 'line-clamp-3'}).text
+                                event = live_div.css_first(_MATCH_EVENT_NAME_SHORT).text()
                             except AttributeError:
                                 event = ''
 
@@ -317,17 +447,19 @@ class Hltv:
                         })
 
             if future:
-                for i, date_div in enumerate(r.find_all('div', {'class': 'upcomingMatchesSection'}), start=1):
+                for i, date_div in enumerate(r.css('div.upcomingMatchesSection'), start=1):
                     if i > days:
                         break
-                    date_ = date_div.find('div', {'class': 'matchDayHeadline'}).text.split()[-1]
+                    date_ = date_div.css_first('div.matchDayHeadline').text().split()[-1]
 
-                    for match in date_div.find_all('div', {'class': 'upcomingMatch'}):
-                        time_ = match.find('div', {'class': 'matchTime'}).text
-                        dtime_ = datetime.strptime(date_ + '/' + time_, "%Y-%m-%d/%H:%M")
-                        dtime = self._localize_datetime_to_timezone(date_=dtime_)
-                        rating = int(match['stars'])
+                    for match in date_div.css('div.upcomingMatch'):
+                        attrs = match.attributes
+                        # filter by stars first, skipped matches are not parsed any further
+                        rating = int(attrs['stars'])
                         if rating >= min_rating:
+                            time_ = match.css_first('div.matchTime').text()
+                            dtime_ = datetime.strptime(date_ + '/' + time_, "%Y-%m-%d/%H:%M")
+                            dtime = self._localize_datetime_to_timezone(date_=dtime_)
                             id_ = 0
                             t1_id = 0
                             t2_id = 0
@@ -335,26 +467,26 @@ class Hltv:
                             team2 = 'TBD'
 
                             try:
-                                id_ = match.find('a')['href'].split('/')[2]
-                                t1_id = match['team1']
-                                t2_id = match['team2']
+                                id_ = match.css_first('a').attributes['href'].split('/')[2]
+                                t1_id = attrs['team1']
+                                t2_id = attrs['team2']
                             except (IndexError, AttributeError, KeyError):
                                 pass
-                            maps = match.find('div', {'class': 'matchMeta'}).text[-1:]
+                            maps = match.css_first('div.matchMeta').text()[-1:]
                             try:
-                                teams = match.find_all('div', {'class': 'matchTeamName text-ellipsis'})
+                                teams = match.css(_MATCH_TEAM_NAME)
 
-                                team1 = teams[0].text
-                                team2 = teams[1].text
+                                team1 = teams[0].text()
+                                team2 = teams[1].text()
                             except (IndexError, AttributeError):
                                 pass
 
                             try:
-                                event = match.find('div', {'class', 'matchEventName gtSmartphone-only'}).text
+                                event = match.css_first(_MATCH_EVENT_NAME).text()
                             except AttributeError:
 
                                 try:
-                                    event = match.find('span', {'class': 'line-clamp-3'}).text
+                                    event = match.css_first(_MATCH_EVENT_NAME_SHORT).text()
                                 except AttributeError:
                                     event = ''
 
@@ -377,62 +509,59 @@ class Hltv:
         return matches
 
     async def get_match_info(self, match_id: str | int, team1: str, team2: str, event_title: str, stats: bool = True):
-        r: BeautifulSoup = await self._fetch(f"https://www.hltv.org/matches/{str(match_id)}/"
-                                             f"{team1.replace(' ', '-')}-vs-"
-                                             f"{team2.replace(' ', '-')}-"
-                                             f"{event_title.replace(' ', '-')}")
+        r: LexborHTMLParser = await self._fetch(f"https://www.hltv.org/matches/{str(match_id)}/"
+                                                f"{team1.replace(' ', '-')}-vs-"
+                                                f"{team2.replace(' ', '-')}-"
+                                                f"{event_title.replace(' ', '-')}")
         if not r:
             return
         status_ = {'Match over': 0, 'LIVE': 1}
 
-        status = r.find('div', {'class': 'countdown'}).text
+        status = r.css_first('div.countdown').text()
 
         status_int = status_[status] if status in status_ else 2
 
-        timestamp = int(r.find('div', {'class': 'time'})['data-unix']) / 1000
+        timestamp = int(r.css_first('div.time').attributes['data-unix']) / 1000
 
         score1, score2 = 0, 0
 
         if status_int == 0:
-            scores = r.find_all('div', class_='team')
-            score1 = scores[0].get_text().replace('\n', '')[-1]
-            score2 = scores[1].get_text().replace('\n', '')[-1]
+            scores = r.css('div.team')
+            score1 = scores[0].text().replace('\n', '')[-1]
+            score2 = scores[1].text().replace('\n', '')[-1]
 
         maps = []
-        for map_div in r.find_all('div', {'class': 'mapholder'}):
-            mapname = map_div.find('div', {'class': 'mapname'}).text
+        for map_div in r.css('div.mapholder'):
+            mapname = map_div.css_first('div.mapname').text()
             pick = ''
             r_team1 = '0'
             r_team2 = '0'
             if mapname != 'TBA':
                 try:
-                    r_teams = map_div.find_all('div', {'class': 'results-team-score'})
-                    r_team1 = r_teams[0].text
-                    r_team2 = r_teams[1].text
+                    r_teams = map_div.css('div.results-team-score')
+                    r_team1 = r_teams[0].text()
+                    r_team2 = r_teams[1].text()
                 except (AttributeError, IndexError, TypeError):
                     r_team1 = '0'
                     r_team2 = '0'
-                try:
-                    if 'pick' in map_div.find('div', class_='results-left')['class']:
-                        pick = team1
-                    elif 'pick' in map_div.find('span', class_='results-right')['class']:
-                        pick = team2
-                except TypeError:
-                    pick = ''
+                if map_div.css_first('div.results-left.pick') is not None:
+                    pick = team1
+                elif map_div.css_first('span.results-right.pick') is not None:
+                    pick = team2
 
             maps.append({'mapname': mapname, 'r_team1': r_team1, 'r_team2': r_team2, 'pick': pick})
 
         stats_ = []
         if stats and status_int == 0:
-            for table_div in r.find_all('table', {'class': 'table totalstats'})[:2]:
-                for player in table_div.find_all('tr')[1:]:
-                    player_id = player.find('a', class_='flagAlign')['href'].split('/')[2]
-                    player_name = player.find('div', class_='statsPlayerName').text.strip()
+            for table_div in r.css('table.table.totalstats')[:2]:
+                for player in table_div.css('tr')[1:]:
+                    player_id = player.css_first('a.flagAlign').attributes['href'].split('/')[2]
+                    player_name = player.css_first('div.statsPlayerName').text().strip()
                     nickname = re.findall(r"'(.*?)'", player_name)[0]
 
-                    kd = player.find('td', class_='kd').text.strip()
-                    adr = player.find('td', class_='adr').text.strip()
-                    rating = player.find('td', class_='rating').text.strip()
+                    kd = player.css_first('td.kd').text().strip()
+                    adr = player.css_first('td.adr').text().strip()
+                    rating = player.css_first('td.rating').text().strip()
                     stats_.append({
                         'id': player_id,
                         'nickname': nickname,
@@ -465,63 +594,67 @@ class Hltv:
                     pass
 
         map_stats_ = []
-        map_stats = r.find_all('div', {"class": "map-stats-infobox-maps"})
+        map_stats = r.css('div.map-stats-infobox-maps')
         for map_stat in map_stats:
             map_stat_ = {}
-            map_stat_["map"] = map_stat.find('div', {"class": "mapname"}).text
-            ps = map_stat.find_all('div', {"class": "map-stats-infobox-winpercentage"})
-            p1 = ps[0].find('a').text
-            p2 = ps[1].find('a').text
+            map_stat_["map"] = map_stat.css_first('div.mapname').text()
+            ps = map_stat.css('div.map-stats-infobox-winpercentage')
+            p1 = ps[0].css_first('a').text()
+            p2 = ps[1].css_first('a').text()
             map_stat_["team1"] = p1
             map_stat_["team2"] = p2
             map_stats_.append(map_stat_)
 
-        teams_box = r.find("div", {"class": "teamsBox"})
-        team_names = teams_box.find_all("div", {"class": "teamName"})
-        pick = r.find_all('div', {"class": "pick-a-winner-team"})
+        teams_box = r.css_first("div.teamsBox")
+        team_names = teams_box.css("div.teamName")
+        name1 = team_names[0].text()
+        name2 = team_names[1].text()
+        pick = r.css('div.pick-a-winner-team')
         try:
-            t1 = pick[0].find("div", "percentage").text
+            t1 = pick[0].css_first("div.percentage").text()
         except IndexError:
             t1 = None
         try:
-            t2 = pick[1].find("div", "percentage").text
+            t2 = pick[1].css_first("div.percentage").text()
         except IndexError:
             t2 = None
         if len(map_stats_) == 0:
             map_stats_ = None
-        logo1 = teams_box.find_all("img", {"alt": team_names[0].text, "height": "60px"})
+        team_logos = teams_box.css('img[height="60px"]')
+        logo1 = [img for img in team_logos if img.attributes.get('alt') == name1]
         if (len(logo1) == 1):
             logo1 = logo1[0]
         else:
             logo1 = logo1[1] if self.night else logo1[0]
-        logo2 = teams_box.find_all("img", {"alt": team_names[1].text, "height": "60px"})
+        logo2 = [img for img in team_logos if img.attributes.get('alt') == name2]
         if (len(logo2) == 1):
             logo2 = logo2[0]
         else:
             logo2 = logo2[1] if self.night else logo2[0]
-        event_logo = r.find_all("img", {'class': "matchSidebarEventLogo"})
+        event_logo = r.css("img.matchSidebarEventLogo")
         if (len(event_logo) == 1):
             event_logo = event_logo[0]
         else:
             event_logo = event_logo[1 if self.night else 0]
-        event_logo = event_logo['srcset'].split(" ")[0] if 'src="' not in event_logo.__str__() else event_logo['src']
+        event_logo = event_logo.attributes
+        event_logo = event_logo['srcset'].split(" ")[0] if 'src' not in event_logo else event_logo['src']
         role1 = "TBD"
         role2 = "TBD"
         r_scoreboard1 = "TBD"
         r_scoreboard2 = "TBD"
         if status == "LIVE":
-            ct_header = r.find('thead', {'class': 'ctTeamHeaderBg'})
-            ct = ct_header.find("div", {'class': 'teamName'}).text[1:]
+            ct_header = r.css_first('thead.ctTeamHeaderBg')
+            ct = ct_header.css_first("div.teamName").text()[1:]
 
-            ct_score = r.find('div', {'class': 'ctScore'}).text
-            t_score = r.find('div', {'class': 'tScore'}).text
+            ct_score = r.css_first('div.ctScore').text()
+            t_score = r.css_first('div.tScore').text()
 
-            if team_names[0].text == ct:
+            if name1 == ct:
                 r_scoreboard1 = ct_score
             else:
                 r_scoreboard1 = t_score
 
-            if team_names[1].text == ct:
+            if name2 == ct:
                 r_scoreboard2 = ct_score
             else:
                 r_scoreboard2 = t_score
@@ -534,26 +667,16 @@ class Hltv:
                 r_scoreboard2 = int(r_scoreboard2)
             except:
                 ...
-            role1 = 'ct' if ct == team_names[0].text else 't'
-            role2 = 'ct' if ct == team_names[1].text else 't'
+            role1 = 'ct' if ct == name1 else 't'
+            role2 = 'ct' if ct == name2 else 't'
         return {'id': match_id, 'score1': score1, 'score2': score2, 'status': status, 'timestamp': timestamp,
                 'maps': maps, 'stats': stats_,
-                "map_stats": map_stats_, "team1": {"name": team_names[0].text,
-                                                   "logo": ('https://www.hltv.org' + logo1['src'] if logo1[
-                                                       'src'].startswith("/") else logo1[
-                                                       'src']) if ' src="' in str(logo1) else (
-                                                       ('https://www.hltv.org' + logo1['srcset'] if logo1[
-                                                           'srcset'].startswith("/") else logo1['srcset']).replace(
-                                                           "&amp;", "&")), "percentage": t1,
+                "map_stats": map_stats_, "team1": {"name": name1,
+                                                   "logo": self._logo_url(logo1), "percentage": t1,
                                                    'role': role1,
                                                    'r_scoreboard': r_scoreboard1},
-                "team2": {"name": team_names[1].text,
-                          "logo": ('https://www.hltv.org' + logo2['src'] if logo2[
-                                                       'src'].startswith("/") else logo2[
-                                                       'src']) if ' src="' in str(logo2) else (
-                                                       ('https://www.hltv.org' + logo2['srcset'] if logo2[
-                                                           'srcset'].startswith("/") else logo2['srcset']).replace(
-                                                           "&amp;", "&")),
+                "team2": {"name": name2,
+                          "logo": self._logo_url(logo2),
                           "percentage": t2, 'role': role2,
                           'r_scoreboard': r_scoreboard2}, "event_logo": event_logo}
 
@@ -571,23 +694,20 @@ class Hltv:
 
         if featured:
             try:
-                big_res = r.find("div", {'class', "big-results"}).find_all("a", {"class": "a-reset"})
+                big_res = r.css_first("div.big-results").css("a.a-reset")
 
                 for res in big_res:
 
-                    try:
-                        rating = len(big_res.find_all('i', {'class': 'fa fa-star star'}))
-                    except AttributeError:
-                        rating = 0
+                    rating = len(res.css(_RESULT_STAR))
 
-                    match_id = res['href'].split('/', 3)[2]
-                    teams = res.find_all('td', class_='team-cell')
-                    team1 = teams[0].get_text().strip()
-                    team2 = teams[1].get_text().strip()
+                    match_id = res.attributes['href'].split('/', 3)[2]
+                    teams = res.css(_RESULT_TEAM)
+                    team1 = teams[0].text().strip()
+                    team2 = teams[1].text().strip()
 
-                    event = res.find('span', class_='event-name').text
+                    event = res.css_first(_RESULT_EVENT).text()
 
-                    scores = res.find("td", class_="result-score").text.strip().split('-')
+                    scores = res.css_first(_RESULT_SCORE).text().strip().split('-')
                     s_t1 = scores[0].strip()
                     s_t2 = scores[1].strip()
 
@@ -607,33 +727,34 @@ class Hltv:
 
             n = 0
 
-            for i, date_div in enumerate(r.find_all('div', class_='results-sublist')[1:], start=1):
+            for i, date_div in enumerate(r.css('div.results-sublist')[1:], start=1):
                 if i > days: break
 
-                date_ = self.__normalize_date(date_div.find('span', class_='standard-headline').text)
+                date_ = self.__normalize_date(date_div.css_first('span.standard-headline').text())
                 date = self._localize_datetime_to_timezone(date_str=date_).strftime('%d-%m-%Y')
 
-                for res in date_div.find_all("a", {"class": "a-reset"}):
-                    if res['href'] == '/forums' or n > max:
+                for res in date_div.css("a.a-reset"):
+                    href = res.attributes['href']
+                    if href == '/forums' or n > max:
                         break
-                    rating = len(res.find_all('i', {'class': 'fa fa-star star'}))
+                    rating = len(res.css(_RESULT_STAR))
 
                     if rating >= min_rating:
                         try:
-                            match_id = res['href'].split('/', 3)[2]
+                            match_id = href.split('/', 3)[2]
                         except IndexError:
                             match_id = 0
                         try:
-                            teams = res.find_all('td', class_='team-cell')
-                            team1 = teams[0].get_text().strip()
-                            team2 = teams[1].get_text().strip()
+                            teams = res.css(_RESULT_TEAM)
+                            team1 = teams[0].text().strip()
+                            team2 = teams[1].text().strip()
                         except (AttributeError, IndexError):
                             team1 = 'TBD'
                             team2 = 'TBD'
 
-                        event = res.find('span', class_='event-name').text
+                        event = res.css_first(_RESULT_EVENT).text()
 
-                        scores = res.find("td", class_="result-score").text.strip().split('-')
+                        scores = res.css_first(_RESULT_SCORE).text().strip().split('-')
                         s_t1 = scores[0].strip()
                         s_t2 = scores[1].strip()
 
@@ -660,23 +781,22 @@ class Hltv:
         match_results = []
 
         n = 0
-        for i, result in enumerate(
-                r.find("div", {'class', 'results-holder'}).find_all("div", {'class', 'results-sublist'}), start=1):
+        for i, result in enumerate(r.css_first("div.results-holder").css("div.results-sublist"), start=1):
             if i > days or n > max_:
                 break
-            date_ = self.__normalize_date(result.find("span", class_="standard-headline").text.strip())
+            date_ = self.__normalize_date(result.css_first("span.standard-headline").text().strip())
             date = self._localize_datetime_to_timezone(date_str=date_).strftime("%d-%m-%Y")
 
-            for match in result.find_all("a", class_="a-reset"):
+            for match in result.css("a.a-reset"):
                 if n > max_:
                     break
 
-                id_ = match['href'].split('/')[2]
-                teams = match.find_all("div", class_="team")
-                team1 = teams[0].text.strip()
-                team2 = teams[1].text.strip()
+                id_ = match.attributes['href'].split('/')[2]
+                teams = match.css("div.team")
+                team1 = teams[0].text().strip()
+                team2 = teams[1].text().strip()
 
-                scores = match.find("td", class_="result-score").text.strip().split('-')
+                scores = match.css_first(_RESULT_SCORE).text().strip().split('-')
                 score_t1 = scores[0].strip()
                 score_t2 = scores[1].strip()
 
@@ -697,67 +817,65 @@ class Hltv:
         if not r:
             return
 
-        live_matches: List | Any
         matches = []
-        try:
-            live_matches = r.find("div", {'class', 'liveMatchesSection'}).find_all("div",
-                                                                                   {'class', 'liveMatch-container'})
-        except AttributeError:
-            live_matches = []
-        for live in live_matches:
-            id_ = live.find('a', {'class': 'match a-reset'})['href'].split('/')[2]
-            teams = live.find_all("div", class_="matchTeamName text-ellipsis")
-            team1 = teams[0].text.strip()
-            team2 = teams[1].text.strip()
-            t1_id = live['team1']
-            t2_id = live['team2']
-
-            # TODO FIX SCORES
-            """try:
-                scores = live.find("td", class_="matchTeamScore").text.strip().split('-')
-                score_team1 = scores[0].strip()
-                score_team2 = scores[1].strip()
-            except AttributeError:
-                score_team1 = 0
-                score_team2 = 0"""
-
-            matches.append({
-                'id': id_,
-                'date': 'LIVE',
-                'team1': team1,
-                'team2': team2,
-                't1_id': t1_id,
-                't2_id': t2_id
-            })
-
-        for date_sect in r.find_all('div', {'class': 'upcomingMatchesSection'}):
-            date_ = datetime.strptime(date_sect.find('span', {'class': 'matchDayHeadline'}).text.split(' ')[-1],
-                                      "%Y-%m-%d")
-            for match in date_sect.find_all('div', {'class': 'upcomingMatch'}):
-                teams_ = match.find_all("div", class_="matchTeamName text-ellipsis")
-                id_ = match.find('a')['href'].split('/')[2]
-                t1_id = 0
-                t2_id = 0
-                time_ = match.find('div', {'class', 'matchTime'}).text
-                team1_ = 'TBD'
-                team2_ = 'TBD'
-                try:
-                    team1_ = teams_[0].text.strip()
-                    team2_ = teams_[1].text.strip()
-                    t1_id = match['team1']
-                    t2_id = match['team2']
-                except IndexError:
-                    pass
+        date_ = None
+        # single document pass, each headline sets the date of the upcoming matches that follow it
+        for node in r.css(_EVENT_MATCH_NODES):
+            if node.tag == 'span':
+                date_ = datetime.strptime(node.text().split(' ')[-1], "%Y-%m-%d")
+                continue
+
+            if 'liveMatch-container' in node.attributes.get('class', ''):
+                id_ = node.css_first('a.match.a-reset').attributes['href'].split('/')[2]
+                teams = node.css(_MATCH_TEAM_NAME)
+                team1 = teams[0].text().strip()
+                team2 = teams[1].text().strip()
+                t1_id = node.attributes['team1']
+                t2_id = node.attributes['team2']
+
+                # TODO FIX SCORES
+                """try:
+                    scores = node.css_first("td.matchTeamScore").text().strip().split('-')
+                    score_team1 = scores[0].strip()
+                    score_team2 = scores[1].strip()
+                except AttributeError:
+                    score_team1 = 0
+                    score_team2 = 0"""
 
                 matches.append({
                     'id': id_,
-                    'date': date_,
-                    'time': time_,
-                    'team1': team1_,
-                    'team2': team2_,
+                    'date': 'LIVE',
+                    'team1': team1,
+                    'team2': team2,
                     't1_id': t1_id,
                     't2_id': t2_id
                 })
+                continue
+
+            teams_ = node.css(_MATCH_TEAM_NAME)
+            id_ = node.css_first('a').attributes['href'].split('/')[2]
+            t1_id = 0
+            t2_id = 0
+            time_ = node.css_first('div.matchTime').text()
+            team1_ = 'TBD'
+            team2_ = 'TBD'
+            try:
+                team1_ = teams_[0].text().strip()
+                team2_ = teams_[1].text().strip()
+                t1_id = node.attributes['team1']
+                t2_id = node.attributes['team2']
+            except IndexError:
+                pass
+
+            matches.append({
+                'id': id_,
+                'date': date_,
+                'time': time_,
+                'team1': team1_,
+                'team2': team2_,
+                't1_id': t1_id,
+                't2_id': t2_id
+            })
 
         return matches
 
@@ -767,17 +885,15 @@ class Hltv:
 
         events = []
         try:
-            for i, event in enumerate(r.find('div', {'class': 'tab-content', 'id': 'FEATURED'}).find_all('a', {
-                'class': 'a-reset ongoing-event'}), start=1):
+            for i, event in enumerate(r.css_first('div.tab-content#FEATURED').css(_ONGOING_EVENT),
+                                      start=1):
                 if i > max_:
                     break
-                event_name = event.find('div', {'class': 'text-ellipsis'}).text.strip()
-                event_start_date = self._normalize_date(
-                    event.find('span', {'data-time-format': 'MMM do'}).text.strip().split())
-
-                event_end_date = self._normalize_date(
-                    event.find_all('span', {'data-time-format': 'MMM do'})[1].text.strip().split())
-                event_id = event['href'].split('/')[-2]
+                event_name = event.css_first('div.text-ellipsis').text().strip()
+                event_dates = event.css(_EVENT_DATE)
+                event_start_date = self._normalize_date(event_dates[0].text().strip().split())
+                event_end_date = self._normalize_date(event_dates[1].text().strip().split())
+                event_id = event.attributes['href'].split('/')[-2]
 
                 events.append({
                     'id': event_id,
@@ -807,15 +923,12 @@ class Hltv:
         events = []
 
         if outgoing:
-            for event in r.find('div', {'class': 'tab-content', 'id': 'TODAY'}).find_all('a', {
-                'class': 'a-reset ongoing-event'}):
-                event_name = event.find('div', {'class': 'text-ellipsis'}).text.strip()
-                event_start_date = self._normalize_date(
-                    event.find('span', {'data-time-format': 'MMM do'}).text.strip().split())
-
-                event_end_date = self._normalize_date(
-                    event.find_all('span', {'data-time-format': 'MMM do'})[1].text.strip().split())
-                event_id = event['href'].split('/')[-2]
+            for event in r.css_first('div.tab-content#TODAY').css(_ONGOING_EVENT):
+                event_name = event.css_first('div.text-ellipsis').text().strip()
+                event_dates = event.css(_EVENT_DATE)
+                event_start_date = self._normalize_date(event_dates[0].text().strip().split())
+                event_end_date = self._normalize_date(event_dates[1].text().strip().split())
+                event_id = event.attributes['href'].split('/')[-2]
 
                 events.append({
                     'id': event_id,
@@ -825,24 +938,21 @@ class Hltv:
                 })
 
         if future:
-            for i, big_event_div in enumerate(r.find_all('div', {'class': 'big-events'}, start=1)):
-                for event in big_event_div.find_all('a', {'class': 'a-reset standard-box big-event'}):
-
-                    if i >= max_events:
-                        break
+            # one query over all big-events sections, max_events caps the total number of future events
+            for event in islice(r.css('div.big-events a.a-reset.standard-box.big-event'), max_events):
+                event_id = event.attributes['href'].split('/')[-2]
+                event_name = event.css_first('div.big-event-name').text().strip()
+                # event_location = event.css_first('span.big-event-location').text().strip()
+                event_dates = event.css('span[class=""]')
+                event_start_date = self._normalize_date(event_dates[0].text().strip().split())
+                event_end_date = self._normalize_date(event_dates[1].text().strip().split())
 
-                    event_id = event['href'].split('/')[-2]
-                    event_name = event.find('div', {'class': 'big-event-name'}).text.strip()
-                    # event_location = event.find('span', {'class': 'big-event-location'}).text.strip()
-                    event_start_date = self._normalize_date(event.find('span', {'class': ''}).text.strip().split())
-                    event_end_date = self._normalize_date(event.find('span', {'class': ''}).text.strip().split())
-
-                    events.append({
-                        'id': event_id,
-                        'title': event_name,
-                        'start_date': event_start_date,
-                        'end_date': event_end_date
-                    })
+                events.append({
+                    'id': event_id,
+                    'title': event_name,
+                    'start_date': event_start_date,
+                    'end_date': event_end_date
+                })
 
         return events
 
@@ -853,25 +963,25 @@ class Hltv:
         if not r:
             return
 
-        event_date_div = r.find('td', {'class', 'eventdate'}).find_all('span')
+        event_date_div = r.css_first('td.eventdate').css('span')
 
-        event_start = self._normalize_date(event_date_div[0].text.split())
-        event_end = self._normalize_date(event_date_div[1].text.split()[1:-1])
+        event_start = self._normalize_date(event_date_div[0].text().split())
+        event_end = self._normalize_date(event_date_div[1].text().split()[1:-1])
 
-        prize = r.find('td', {'class', 'prizepool text-ellipsis'}).text
+        prize = r.css_first('td.prizepool.text-ellipsis').text()
 
-        team_num = r.find('td', {'class', 'teamsNumber'}).text
+        team_num = r.css_first('td.teamsNumber').text()
 
-        location = r.find('td', {'class', 'location gtSmartphone-only'}).get_text().replace('\n', '')
+        location = r.css_first('td.location.gtSmartphone-only').text().replace('\n', '')
 
         try:
-            group_div = r.find('div', {'class', 'groups-container'})
+            group_div = r.css_first('div.groups-container')
             groups = []
-            for group in group_div.find_all('table', {'class': 'table standard-box'}):
-                group_name = group.find('td', {'class': 'table-header group-name'}).text
+            for group in group_div.css('table.table.standard-box'):
+                group_name = group.css_first('td.table-header.group-name').text()
                 teams = []
-                for team in group.find_all('div', 'text-ellipsis'):
-                    teams.append(team.find('a').text)
+                for team in group.css('div.text-ellipsis'):
+                    teams.append(team.css_first('a').text())
                 groups.append({group_name: teams})
         except AttributeError:
             groups = []
@@ -894,7 +1004,14 @@ class Hltv:
         [('rank','title','points', 'change', 'id')]
         change - difference between last ranking update
         """
-        today = date.today()
+        # hltv's date, so the cache key and the ranking url always point to the same week
+        today = datetime.now(tz=pytz.timezone('Europe/Copenhagen')).date()
+        iso = today.isocalendar()
+        key = f"{iso.year}-W{iso.week}-{max_teams}"
+        if self._rank_cache and self._rank_cache[0] == key:
+            # copies, callers must not change the cached result
+            return [dict(team) for team in self._rank_cache[1]]
+
         current_weekday = today.weekday()
         last_monday = today - timedelta(days=current_weekday)
 
@@ -906,41 +1023,27 @@ class Hltv:
             return
 
         try:
-            for i, team in enumerate(r.find_all("div", {'class': "ranked-team standard-box"}), start=1):
+            # rows are selected once, cells are looked up inside their own row so a missing
+            # optional cell only affects that row
+            for i, team in enumerate(r.css(_RANKED_TEAM), start=1):
                 if i > max_teams:
                     break
 
-                rank = team.find('span', {'class': 'position'}).text[1:]
-                title_div: Any
-                if rank != '1':
-                    title_div = team.find('div', {'class': 'teamLine sectionTeamPlayers'})
-                else:
-                    title_div = team.find('div', {'class': 'teamLine sectionTeamPlayers teamLineExpanded'})
-
-                title = title_div.find('span', {'class': 'name'}).text
-                points = title_div.find('span', {'class': 'points'}).text.split(' ', 1)[0][1:]
-
-                id_ = team.find('a', {'class': 'details moreLink'})['href'].split('/')[-1]
-
-                changes = {'change positive', 'change neutral', 'change negative'}
-                change = ''
-                for change_ in changes:
-                    try:
-                        change = team.find('div', {'class', change_}).text
-                        break
-                    except AttributeError:
-                        pass
+                # the first team's line is additionally marked teamLineExpanded
+                title_div = team.css_first('div.teamLine.sectionTeamPlayers')
+                change_div = team.css_first(_TEAM_CHANGE)
 
                 teams.append({
-                    'id': id_,
-                    'rank': rank,
-                    'title': title,
-                    'points': points,
-                    'change': change,
+                    'id': team.css_first('a.details.moreLink').attributes['href'].split('/')[-1],
+                    'rank': team.css_first('span.position').text()[1:],
+                    'title': title_div.css_first('span.name').text(),
+                    'points': title_div.css_first('span.points').text().split(' ', 1)[0][1:],
+                    'change': change_div.text() if change_div is not None else '',
                 })
         except AttributeError:
             raise AttributeError("Parsing error, probably page not fully loaded")
 
+        self._rank_cache = (key, [dict(team) for team in teams])
         return teams
 
     async def get_team_info(self, team_id: int | str, title: str) -> dict[str, list[str]]:
@@ -956,33 +1059,34 @@ class Hltv:
         r = await self._fetch("https://www.hltv.org/team/" + str(team_id) + '/' + title.replace(' ', '-'))
         players = []
         try:
-            for player in r.find_all('span', {'class': 'text-ellipsis bold'}):
-                players.append(player.text)
+            for player in r.css('span.text-ellipsis.bold'):
+                players.append(player.text())
 
             rank = '0'
             weeks = '0'
             age = '0'
             coach = ''
 
-            for i, stat in enumerate(r.find_all('div', {'class': 'profile-team-stat'}), start=1):
+            for i, stat in enumerate(r.css('div.profile-team-stat'), start=1):
                 try:
                     if i == 1:
-                        rank = stat.find('a').text[1:]
+                        rank = stat.css_first('a').text()[1:]
                     elif i == 2:
-                        weeks = stat.find('span', {'class': 'right'}).text
+                        weeks = stat.css_first('span.right').text()
                     elif i == 3:
-                        age = stat.find('span', {'class': 'right'}).text
+                        age = stat.css_first('span.right').text()
                     elif i == 4:
-                        coach = stat.find('span', {'class': 'bold a-default'}).text[1:-1]
+                        coach = stat.css_first('span.bold.a-default').text()[1:-1]
                 except AttributeError:
                     pass
 
             last_trophy = None
             total_trophies = None
             try:
-                last_trophy = r.find('div', {'class': 'trophyHolder'}).find('span')['title']
-                total_trophies = len(r.find_all('div', {'class': 'trophyHolder'}))
-            except AttributeError:
+                trophies = r.css('div.trophyHolder')
+                last_trophy = trophies[0].css_first('span').attributes['title']
+                total_trophies = len(trophies)
+            except (AttributeError, IndexError):
                 pass
 
             return {'id': team_id,
@@ -1014,37 +1118,24 @@ class Hltv:
             return
 
         players = []
-        rank = 1
         try:
-            for player in r.find('tbody').find_all('tr'):
-                name_div = player.find('td', {'class', 'playerCol'}).find('a')
-                id_ = name_div['href'].split('/')[3]
-                name = name_div.text
-                team = player.find('td', {'class', 'teamCol'})['data-sort']
-
-                maps = player.find('td', {'class', 'statsDetail'}).text
-
-                ratings = {'ratingCol ratingPositive', 'ratingCol ratingNeutral', 'ratingCol ratingNegative'}
-                rating = 'ERROR'
-                for rat in ratings:
-                    try:
-                        rating = player.find('td', {'class', rat}).text
+            for rank, player in enumerate(r.css_first('tbody').css('tr'), start=1):
+                if rank > top:
+                    break
 
-                        break
-                    except AttributeError:
-                        pass
+                name_div = player.css_first('td.playerCol a')
+                # maps played is the first statsDetail cell of a row
+                maps = player.css_first('td.statsDetail')
+                rating_td = player.css_first(_PLAYER_RATING)
 
                 players.append({
-                    'id': id_,
+                    'id': name_div.attributes['href'].split('/')[3],
                     'rank': rank,
-                    'name': name,
-                    'team': team,
-                    'maps': maps,
-                    'rating': rating,
+                    'name': name_div.text(),
+                    'team': player.css_first('td.teamCol').attributes['data-sort'],
+                    'maps': maps.text(),
+                    'rating': rating_td.text() if rating_td is not None else 'ERROR',
                 })
-                rank += 1
-                if rank > top:
-                    break
         except AttributeError:
             raise AttributeError("Top players parsing error, probably page not fully loaded")
 
@@ -1063,15 +1154,14 @@ class Hltv:
 
         news = []
         reg_news_num = 0
-        for i, news_date_div in enumerate(r.find_all('div', {'class', 'standard-box standard-list'}), start=1):
+        for i, news_date_div in enumerate(r.css('div.standard-box.standard-list'), start=1):
             date_ = article_days[i]
             f_news = []
             reg_news = []
-            for featured_news_div in news_date_div.find_all('a',
-                                                            {'class': 'newsline article featured breaking-featured'}):
-                featured_id = featured_news_div['href'].split('/')[2]
-                featured_title = featured_news_div.find('div', {'class': 'featured-newstext'}).text
-                featured_description = featured_news_div.find('div', {'class': 'featured-small-newstext'}).text
+            for featured_news_div in news_date_div.css('a.newsline.article.featured.breaking-featured'):
+                featured_id = featured_news_div.attributes['href'].split('/')[2]
+                featured_title = featured_news_div.css_first('div.featured-newstext').text()
+                featured_description = featured_news_div.css_first('div.featured-small-newstext').text()
                 f_news.append({
                     'f_id': featured_id,
                     'f_title': featured_title,
@@ -1079,21 +1169,19 @@ class Hltv:
                 })
 
             if not only_featured and reg_news_num < max_reg_news:
-                for news_div in news_date_div.find_all('a',
-                                                       {'class': 'newsline article'}):
+                for news_div in news_date_div.css('a.newsline.article:not(.featured)'):
                     if reg_news_num > max_reg_news:
                         break
-                    if news_div['class'] != 'newsline article featured breaking-featured':
-                        news_id = news_div['href'].split('/')[2]
-                        news_title = news_div.find('div', {'class': 'newstext'}).text
-                        news_posted = news_div.find('div', {'class': 'newsrecent'}).text
-
-                        reg_news.append({
-                            'id': news_id,
-                            'title': news_title,
-                            'posted': news_posted,
-                        })
-                        reg_news_num += 1
+                    news_id = news_div.attributes['href'].split('/')[2]
+                    news_title = news_div.css_first('div.newstext').text()
+                    news_posted = news_div.css_first('div.newsrecent').text()
+
+                    reg_news.append({
+                        'id': news_id,
+                        'title': news_title,
+                        'posted': news_posted,
+                    })
+                    reg_news_num += 1
 
             news.append({
                 'date': date_,
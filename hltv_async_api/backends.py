@@ -0,0 +1,132 @@
+from collections import OrderedDict
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+# max number of proxy clients kept open by the httpx backend
+_MAX_CLIENTS = 4
+
+
+class IdleCloser:
+    """Counts requests running on clients, retired clients are closed once their last request is finished"""
+
+    def __init__(self, close):
+        self._close = close
+        self.active = {}
+        self.retired = set()
+
+    def acquire(self, client):
+        # counted before any await, so the client can't be closed before it is used
+        self.active[client] = self.active.get(client, 0) + 1
+        return client
+
+    async def release(self, client):
+        self.active[client] -= 1
+        if not self.active[client]:
+            del self.active[client]
+        await self.close_idle()
+
+    def retire(self, client):
+        self.retired.add(client)
+
+    async def close_idle(self):
+        for client in [client for client in self.retired if client not in self.active]:
+            self.retired.discard(client)
+            await self._close(client)
+
+    async def close_all(self):
+        clients, self.retired, self.active = self.retired, set(), {}
+        for client in clients:
+            await self._close(client)
+
+
+class AiohttpBackend:
+    """Default backend, one pooled aiohttp session for all requests"""
+    name = 'aiohttp'
+
+    def __init__(self, headers: dict, timeout: int, max_connections: int):
+        self.max_connections = max_connections
+        # one long-lived session keeps connections to flaresolverr alive between fetches
+        connector = TCPConnector(limit=max_connections, limit_per_host=max_connections, ttl_dns_cache=300,
+                                 keepalive_timeout=75)
+        self.session = ClientSession(connector=connector, headers=headers, timeout=ClientTimeout(total=timeout))
+
+    async def post(self, url: str, payload: dict, proxy: str, timeout: int) -> tuple[int, dict | None]:
+        async with self.session.post(url, json=payload, proxy=proxy or None,
+                                     timeout=ClientTimeout(total=timeout)) as response:
+            # 403/404 bodies are not flaresolverr json
+            if response.status == 403 or response.status == 404:
+                return response.status, None
+            return response.status, await response.json()
+
+    async def discard(self, proxy: str):
+        # proxy is passed per request, nothing is bound to it
+        pass
+
+    async def close(self):
+        await self.session.close()
+
+
+class HttpxBackend:
+    """httpx backend with HTTP/2, requires httpx[http2] (pip install hltv-async-api[httpx])"""
+    name = 'httpx'
+
+    def __init__(self, headers: dict, timeout: int, max_connections: int):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("httpx backend requires httpx[http2], install it with: pip install 'httpx[http2]'")
+
+        self._httpx = httpx
+        self.headers = headers
+        self.timeout = timeout
+        self.max_connections = max_connections
+        # httpx binds a proxy to the client, so there is one client per proxy ('' - no proxy),
+        # least recently used clients are dropped above _MAX_CLIENTS
+        self.clients: OrderedDict = OrderedDict()
+        self._in_use = IdleCloser(lambda client: client.aclose())
+
+    def _get_client(self, proxy: str):
+        """Returns the client of a proxy counted as busy, release it with _in_use.release()"""
+        client = self.clients.get(proxy)
+        if client is not None:
+            self.clients.move_to_end(proxy)
+        else:
+            client = self._httpx.AsyncClient(http2=True, headers=self.headers, timeout=self.timeout,
+                                             proxy=proxy or None,
+                                             limits=self._httpx.Limits(max_connections=self.max_connections,
+                                                                       max_keepalive_connections=self.max_connections))
+            self.clients[proxy] = client
+        self._in_use.acquire(client)
+
+        if len(self.clients) > _MAX_CLIENTS:
+            self._in_use.retire(self.clients.popitem(last=False)[1])
+        return client
+
+    async def post(self, url: str, payload: dict, proxy: str, timeout: int) -> tuple[int, dict | None]:
+        client = self._get_client(proxy)
+        try:
+            response = await client.post(url, json=payload, timeout=timeout)
+            if response.status_code == 403 or response.status_code == 404:
+                return response.status_code, None
+            return response.status_code, response.json()
+        finally:
+            await self._in_use.release(client)
+
+    async def discard(self, proxy: str):
+        """Drops the client of a proxy, it is closed once its last request is finished"""
+        client = self.clients.pop(proxy, None)
+        if client is not None:
+            self._in_use.retire(client)
+            await self._in_use.close_idle()
+
+    async def close(self):
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients = OrderedDict()
+        await self._in_use.close_all()
+
+
+BACKENDS = {
+    AiohttpBackend.name: AiohttpBackend,
+    HttpxBackend.name: HttpxBackend,
+}
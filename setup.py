@@ -14,9 +14,11 @@ setup(
     install_requires=[
         'aiohttp',
         'pytz',
-        'lxml',
-        'beautifulsoup4',
+        'selectolax',
     ],
+    extras_require={
+        'httpx': ['httpx[http2]>=0.26'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from hltv_async_api.backends import _MAX_CLIENTS, HttpxBackend
+
+pytest.importorskip('httpx')
+
+
+@pytest.mark.asyncio
+async def test_httpx_clients_are_bounded():
+    backend = HttpxBackend({}, 5, 16)
+    proxies = [f'http://127.0.0.1:{port}' for port in range(9000, 9000 + _MAX_CLIENTS + 2)]
+
+    clients = []
+    for proxy in proxies:
+        clients.append(backend._get_client(proxy))
+        await backend._in_use.release(clients[-1])
+
+    assert list(backend.clients) == proxies[-_MAX_CLIENTS:]
+    assert all(client.is_closed for client in clients[:2])
+    assert not any(client.is_closed for client in clients[2:])
+    await backend.close()
+    assert all(client.is_closed for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_httpx_discarded_proxy_is_closed():
+    backend = HttpxBackend({}, 5, 16)
+    client = backend._get_client('http://127.0.0.1:9000')
+    await backend._in_use.release(client)
+
+    await backend.discard('http://127.0.0.1:9000')
+
+    assert client.is_closed
+    assert not backend.clients
+
+
+@pytest.mark.asyncio
+async def test_httpx_busy_clients_are_not_closed_by_eviction():
+    backend = HttpxBackend({}, 5, 16)
+    for port in range(9000, 9000 + _MAX_CLIENTS):
+        await backend._in_use.release(backend._get_client(f'http://127.0.0.1:{port}'))
+
+    async def use(proxy):
+        client = backend._get_client(proxy)
+        await asyncio.sleep(0.01)
+        closed = client.is_closed
+        await backend._in_use.release(client)
+        return closed
+
+    proxies = [f'http://127.0.0.1:{port}' for port in range(9100, 9106)]
+    assert await asyncio.gather(*(use(proxy) for proxy in proxies)) == [False] * len(proxies)
+    assert list(backend.clients) == proxies[-_MAX_CLIENTS:]
+    assert not backend._in_use.retired and not backend._in_use.active
+    await backend.close()
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from hltv_async_api import Hltv
+from hltv_async_api.backends import BACKENDS
+
+
+def _slow_fetch_page(hltv: Hltv, result='page', delay=0.05):
+    calls = []
+
+    async def fetch_page(url):
+        calls.append(url)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            calls.append('cancelled')
+            raise
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    hltv._fetch_page = fetch_page
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_fetch():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    calls = _slow_fetch_page(hltv)
+
+    results = await asyncio.gather(*(hltv._fetch('https://www.hltv.org/') for _ in range(3)))
+
+    assert results == ['page'] * 3
+    assert len(calls) == 1
+    assert hltv._in_flight == {}
+    # served from the page cache
+    assert await hltv._fetch('https://www.hltv.org/') == 'page'
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_leader_cancellation_does_not_cancel_followers():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    calls = _slow_fetch_page(hltv)
+
+    leader = asyncio.ensure_future(asyncio.wait_for(hltv._fetch('https://www.hltv.org/'), 0.01))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(hltv._fetch('https://www.hltv.org/'))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await leader
+    assert await follower == 'page'
+    assert len(calls) == 1
+    assert hltv._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_last_caller_cancellation_stops_fetch():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    calls = _slow_fetch_page(hltv, delay=10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(hltv._fetch('https://www.hltv.org/'), 0.01)
+    await asyncio.sleep(0)
+
+    assert calls == ['https://www.hltv.org/', 'cancelled']
+    assert hltv._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_in_flight_fetches():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    calls = _slow_fetch_page(hltv, delay=10)
+
+    caller = asyncio.ensure_future(hltv._fetch('https://www.hltv.org/'))
+    await asyncio.sleep(0.01)
+    await hltv.close()
+
+    assert calls == ['https://www.hltv.org/', 'cancelled']
+    assert hltv._in_flight == {}
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_reaches_every_caller():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    _slow_fetch_page(hltv, result=ImportError('httpx is not installed'))
+
+    results = await asyncio.gather(*(hltv._fetch('https://www.hltv.org/') for _ in range(2)),
+                                   return_exceptions=True)
+
+    assert [type(result) for result in results] == [ImportError, ImportError]
+    assert hltv._in_flight == {}
+    assert hltv._page_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_backend_switch_creates_one_backend(monkeypatch):
+    created = []
+
+    class Backend:
+        def __init__(self, headers, timeout, max_connections):
+            self.max_connections = max_connections
+            created.append(self)
+
+        async def close(self):
+            await asyncio.sleep(0.01)
+
+    for name in ('aiohttp', 'httpx'):
+        monkeypatch.setitem(BACKENDS, name, type(name, (Backend,), {'name': name}))
+
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    await hltv._create_session()
+    hltv.config(backend='httpx')
+    await asyncio.gather(*(hltv._create_session() for _ in range(3)))
+
+    assert [backend.name for backend in created] == ['aiohttp', 'httpx']
+    assert hltv._backend is created[-1]
+
+    # the connection pool follows max_concurrency
+    hltv.config(max_concurrency=4)
+    await hltv._create_session()
+    assert [backend.max_connections for backend in created] == [16, 16, 4]
+    await hltv.close()
+
+
+@pytest.mark.asyncio
+async def test_replaced_backend_is_closed_after_its_requests(monkeypatch):
+    class Backend:
+        name = 'aiohttp'
+
+        def __init__(self, headers, timeout, max_connections):
+            self.max_connections = max_connections
+            self.closed = False
+
+        async def post(self, url, payload, proxy, timeout):
+            await asyncio.sleep(0.05)
+            assert not self.closed
+            return 200, {'solution': {'response': '<html></html>'}}
+
+        async def close(self):
+            self.closed = True
+
+    monkeypatch.setitem(BACKENDS, 'aiohttp', Backend)
+
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    await hltv._create_session()
+    old = hltv._backend
+    request = asyncio.ensure_future(hltv._parse('https://www.hltv.org/'))
+    await asyncio.sleep(0.01)
+
+    hltv.config(max_concurrency=4)
+    await hltv._create_session()
+    assert hltv._backend is not old
+    assert not old.closed
+
+    assert await request is not None
+    assert old.closed
+    await hltv.close()
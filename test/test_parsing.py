@@ -0,0 +1,120 @@
+import pytest
+
+from hltv_async_api import Hltv
+from hltv_async_api.aiohltv import _parse_html
+
+RANKING = """
+<div class="ranked-team standard-box">
+    <span class="position">#1</span>
+    <div class="teamLine teamLineExpanded sectionTeamPlayers">
+        <span class="name">FaZe</span><span class="points">(939 points)</span>
+    </div>
+    <div class="change positive">+1</div>
+    <a class="details moreLink" href="/team/6667/faze">Details</a>
+</div>
+<div class="ranked-team standard-box">
+    <span class="position">#2</span>
+    <div class="teamLine sectionTeamPlayers">
+        <span class="name">Natus Vincere</span><span class="points">(757 points)</span>
+    </div>
+    <a class="details moreLink" href="/team/4608/natus-vincere">Details</a>
+</div>
+"""
+
+PLAYERS = """
+<table><tbody>
+<tr>
+    <td class="playerCol"><a href="/stats/players/19230/m0NESY">m0NESY</a></td>
+    <td class="teamCol" data-sort="G2"></td>
+    <td class="statsDetail">44</td><td class="statsDetail">900</td>
+    <td class="ratingCol ratingPositive">1.37</td>
+</tr>
+<tr>
+    <td class="playerCol"><a href="/stats/players/18053/broky">broky</a></td>
+    <td class="teamCol" data-sort="FaZe"></td>
+    <td class="statsDetail">54</td><td class="statsDetail">1100</td>
+    <td class="ratingCol">1.00</td>
+</tr>
+</tbody></table>
+"""
+
+
+def _serve(hltv: Hltv, html: str):
+    async def fetch(url):
+        return _parse_html(html)
+    hltv._fetch = fetch
+
+
+@pytest.mark.asyncio
+async def test_top_teams_missing_change():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    _serve(hltv, RANKING)
+
+    teams = await hltv.get_top_teams()
+
+    assert [team['title'] for team in teams] == ['FaZe', 'Natus Vincere']
+    assert [team['change'] for team in teams] == ['+1', '']
+    assert teams[1]['id'] == 'natus-vincere'
+    assert teams[1]['points'] == '757'
+
+
+@pytest.mark.asyncio
+async def test_best_players_missing_rating():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    _serve(hltv, PLAYERS)
+
+    players = await hltv.get_best_players()
+
+    assert [player['name'] for player in players] == ['m0NESY', 'broky']
+    assert [player['maps'] for player in players] == ['44', '54']
+    assert [player['rating'] for player in players] == ['1.37', 'ERROR']
+    assert players[1]['team'] == 'FaZe'
+
+
+@pytest.mark.asyncio
+async def test_top_teams_cache_returns_copies():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    _serve(hltv, RANKING)
+
+    teams = await hltv.get_top_teams()
+    teams[0]['title'] = 'changed'
+    teams.pop()
+
+    # same week, the ranking must not be fetched again
+    _serve(hltv, '')
+    cached = await hltv.get_top_teams()
+    assert [team['title'] for team in cached] == ['FaZe', 'Natus Vincere']
+
+
+EVENTS = """
+<div class="big-events">
+    <a class="a-reset standard-box big-event" href="/events/8000/big-one">
+        <div class="big-event-name">Big One</div>
+        <span class="big-event-location">Cologne</span><span class="">May 1st</span> - <span class="">May 9th</span>
+    </a>
+    <a class="a-reset standard-box big-event" href="/events/8001/big-two">
+        <div class="big-event-name">Big Two</div><span class="">Jun 2nd</span> - <span class="">Jun 23rd</span>
+    </a>
+</div>
+<div class="big-events">
+    <a class="a-reset standard-box big-event" href="/events/8002/big-three">
+        <div class="big-event-name">Big Three</div><span class="">Jul 4th</span> - <span class="">Jul 5th</span>
+    </a>
+    <a class="a-reset standard-box big-event" href="/events/8003/big-four">
+        <div class="big-event-name">Big Four</div><span class="">Aug 1st</span> - <span class="">Aug 8th</span>
+    </a>
+</div>
+"""
+
+
+@pytest.mark.asyncio
+async def test_future_events_dates_and_cap():
+    hltv = Hltv(flaresolverr="http://localhost:8191")
+    _serve(hltv, EVENTS)
+
+    events = await hltv.get_events(outgoing=False, max_events=3)
+
+    # the cap is applied across both big-events sections
+    assert [event['title'] for event in events] == ['Big One', 'Big Two', 'Big Three']
+    assert [(event['start_date'], event['end_date']) for event in events] == [
+        ('1-5', '9-5'), ('2-6', '23-6'), ('4-7', '5-7')]